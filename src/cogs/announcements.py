@@ -1,20 +1,75 @@
 """Announcements ABC class cog for QuBot."""
 
 from abc import ABC, ABCMeta, abstractmethod
-from datetime import datetime
-from typing import Any, Optional
-from zoneinfo import ZoneInfo
-
-from discord import Embed, TextChannel
+from asyncio import Queue, Task, create_task, sleep
+from functools import lru_cache
+from logging import Logger, getLogger
+from typing import Any, ClassVar, Optional
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
+from discord import Embed, HTTPException, TextChannel
+from discord.abc import GuildChannel
 from discord.ext.commands import Bot, Cog
 from discord.ext.commands.cog import CogMeta
-from discord.ext.tasks import Loop, loop
 from discord.ui import View
 
-from utils import load_json
+from utils import ZONE_INFO, load_json
 
-ZONE_INFO: ZoneInfo = ZoneInfo("Europe/Rome")
 COLOR_BLUE: int = 0x4285F4
+SEND_DELAY: float = 0.25
+FIELD_VALUE_LIMIT: int = 1024
+EMBED_FIELD_LIMIT: int = 25
+EMBED_TOTAL_LIMIT: int = 6000
+logger: Logger = getLogger(__name__)
+
+
+@lru_cache(maxsize=128)
+def cron_trigger(day: int, hour: int, minute: int) -> CronTrigger:
+    """Return the weekly Europe/Rome trigger for a time slot, shared across cogs."""
+    return CronTrigger(day_of_week=day, hour=hour, minute=minute, timezone=ZONE_INFO)
+
+
+class ChannelSender:
+    """Per-channel queue that paces outgoing messages to respect rate limits."""
+
+    _senders: ClassVar[dict[int, "ChannelSender"]] = {}
+
+    def __init__(self, channel: TextChannel) -> None:
+        self.channel: TextChannel = channel
+        self.queue: Queue[tuple[Embed, Optional[View]]] = Queue()
+        self.worker: Optional[Task[None]] = None
+
+    @classmethod
+    def for_channel(cls, channel: TextChannel) -> "ChannelSender":
+        """Return the shared sender for a channel, creating it on first use."""
+        sender: Optional[ChannelSender] = cls._senders.get(channel.id)
+        if sender is None:
+            sender = cls._senders[channel.id] = cls(channel)
+        return sender
+
+    @classmethod
+    def forget(cls, channel_id: int) -> None:
+        """Drop the shared sender of a channel, e.g. after it was deleted."""
+        cls._senders.pop(channel_id, None)
+
+    def enqueue(self, embed: Embed, view: Optional[View] = None) -> None:
+        """Queue a message and make sure the worker is running."""
+        self.queue.put_nowait((embed, view))
+        if self.worker is None or self.worker.done():
+            self.worker = create_task(self._run())
+
+    async def _run(self) -> None:
+        """Send queued messages one at a time, logging and skipping failed sends."""
+        while not self.queue.empty():
+            embed, view = self.queue.get_nowait()
+            try:
+                await self.channel.send(embed=embed, view=view)
+            except Exception:
+                logger.exception(
+                    "Failed to send a message to channel %s", self.channel.id
+                )
+            await sleep(SEND_DELAY)
 
 
 class CombinedMeta(CogMeta, ABCMeta):
@@ -29,12 +84,70 @@ class Announcements(Cog, ABC, metaclass=CombinedMeta):
         self.channel_id: int = channel_id
         self.messages: dict[str, Any] = load_json(messages_path)
         self.message_key: str = self.__class__.__name__
+        self.job_ids: list[str] = []
+        self._channels: dict[int, TextChannel] = {}
 
-        self.announcement: Loop = loop(minutes=1)(self._announce)
-        self.announcement.before_loop(self._before_loop)
-
-        if not self.announcement.is_running():
-            self.announcement.start()
+        self._schedule: dict[tuple[int, int, int], list[dict[str, Any]]] = {}
+        for content in self.messages[self.message_key]["content"]:
+            time: dict[str, int] = content["time"]
+            key = (time["day"], time["hour"], time["minute"])
+            self._schedule.setdefault(key, []).append(content)
+
+    async def cog_load(self) -> None:
+        """Schedule announcements now if the bot is already ready (e.g. on reload)."""
+        if self.bot.is_ready():
+            self._schedule_jobs()
+
+    @Cog.listener()
+    async def on_ready(self) -> None:
+        """Schedule announcements once the bot is ready."""
+        self._schedule_jobs()
+
+    def _schedule_jobs(self) -> None:
+        """Schedule one cron job per announcement time on the shared scheduler."""
+        if not self._schedule or self.job_ids:
+            return
+
+        scheduler: AsyncIOScheduler = self.bot.scheduler
+        for (day, hour, minute), contents in self._schedule.items():
+            job_id: str = f"{self.message_key}:{day}:{hour}:{minute}"
+            scheduler.add_job(
+                self._announce,
+                cron_trigger(day, hour, minute),
+                args=(contents,),
+                id=job_id,
+                replace_existing=True,
+            )
+            self.job_ids.append(job_id)
+
+    async def cog_unload(self) -> None:
+        """Remove this cog's jobs from the shared scheduler."""
+        scheduler: AsyncIOScheduler = self.bot.scheduler
+        for job_id in self.job_ids:
+            if scheduler.get_job(job_id) is not None:
+                scheduler.remove_job(job_id)
+        self.job_ids.clear()
+
+    @Cog.listener()
+    async def on_guild_channel_delete(self, channel: GuildChannel) -> None:
+        """Forget cached handles for a deleted channel."""
+        self._channels.pop(channel.id, None)
+        ChannelSender.forget(channel.id)
+
+    async def resolve_channel(self, channel_id: int) -> Optional[TextChannel]:
+        """Return the text channel for an ID, caching it after the first lookup."""
+        channel = self._channels.get(channel_id)
+        if channel is None:
+            channel = self.bot.get_channel(channel_id)
+            if channel is None:
+                try:
+                    channel = await self.bot.fetch_channel(channel_id)
+                except HTTPException:
+                    return None
+            if not isinstance(channel, TextChannel):
+                return None
+            self._channels[channel_id] = channel
+        return channel
 
     async def send_announcement(
         self,
@@ -46,8 +159,8 @@ class Announcements(Cog, ABC, metaclass=CombinedMeta):
         view: Optional[View] = None,
     ) -> None:
         """Send an embedded announcement message to a text channel."""
-        channel = self.bot.get_channel(channel_id)
-        if isinstance(channel, TextChannel):
+        channel = await self.resolve_channel(channel_id)
+        if channel is not None:
             embed = Embed(title=title, description=description, color=color)
 
             if (
@@ -61,34 +174,70 @@ class Announcements(Cog, ABC, metaclass=CombinedMeta):
                     inline=add_field.get("inline", False),
                 )
 
-            await channel.send(embed=embed, view=view)
+            ChannelSender.for_channel(channel).enqueue(embed, view)
 
     @abstractmethod
-    def prepare_announcement(
+    async def prepare_announcement(
         self, content: dict[str, Any]
-    ) -> tuple[dict[str, int], dict[str, str], Optional[View]]:
+    ) -> tuple[dict[str, str], Optional[View]]:
         """Prepare announcement data and optional view."""
 
-    async def _announce(self) -> None:
-        """Task loop function that checks current time and sends announcements."""
-        now: datetime = datetime.now(ZONE_INFO)
+    async def send_digest(
+        self,
+        channel_id: int,
+        contents: list[dict[str, str]],
+        color: int = COLOR_BLUE,
+    ) -> None:
+        """Send several announcements as fields of as few embedded messages as fit.
+
+        A new embed is started before Discord's field count or total size limit.
+        """
+        channel = await self.resolve_channel(channel_id)
+        if channel is not None:
+            sender = ChannelSender.for_channel(channel)
+            embed = Embed(color=color)
+            for content in contents:
+                size: int = len(content["title"]) + len(content["description"])
+                if (
+                    len(embed.fields) == EMBED_FIELD_LIMIT
+                    or len(embed) + size > EMBED_TOTAL_LIMIT
+                ):
+                    sender.enqueue(embed)
+                    embed = Embed(color=color)
+                embed.add_field(
+                    name=content["title"], value=content["description"], inline=False
+                )
+            sender.enqueue(embed)
 
-        for content in self.messages[self.message_key]["content"]:
-            time, content_formatted, view = self.prepare_announcement(content)
+    async def _announce(self, contents: list[dict[str, Any]]) -> None:
+        """Scheduled job that sends every announcement due at the same time.
 
+        Entries without a view or an extra field, whose description fits in an
+        embed field value, are coalesced into digest embeds.
+        """
+        digest: list[dict[str, str]] = []
+        for content in contents:
+            content_formatted, view = await self.prepare_announcement(content)
             if (
-                now.weekday() == time["day"]
-                and now.hour == time["hour"]
-                and now.minute == time["minute"]
+                view is None
+                and "add_field" not in content_formatted
+                and len(content_formatted["description"]) <= FIELD_VALUE_LIMIT
             ):
-                await self.send_announcement(
-                    channel_id=self.channel_id,
-                    title=content_formatted["title"],
-                    description=content_formatted["description"],
-                    add_field=content_formatted.get("add_field"),
-                    view=view,
-                )
-
-    async def _before_loop(self) -> None:
-        """Wait until the bot is ready before starting the announcement loop."""
-        await self.bot.wait_until_ready()
+                digest.append(content_formatted)
+                continue
+            await self.send_announcement(
+                channel_id=self.channel_id,
+                title=content_formatted["title"],
+                description=content_formatted["description"],
+                add_field=content_formatted.get("add_field"),
+                view=view,
+            )
+
+        if len(digest) == 1:
+            await self.send_announcement(
+                channel_id=self.channel_id,
+                title=digest[0]["title"],
+                description=digest[0]["description"],
+            )
+        elif digest:
+            await self.send_digest(channel_id=self.channel_id, contents=digest)
@@ -1,25 +1,26 @@
 """Elsa class cog for QuBot."""
 
-from os import getenv
+from logging import Logger, getLogger
 from typing import Any, Optional
 
 from discord import ButtonStyle, Interaction
 from discord.ext.commands import Bot
 from discord.ui import Button, View
-from dotenv import load_dotenv
 
 from cogs.announcements import Announcements
+from utils import EnvConfig, env_config
+
+logger: Logger = getLogger(__name__)
 
 
 class Elsa(Announcements):
     """Cog for scheduling and sending announcements about Elsa."""
 
-    def prepare_announcement(
+    async def prepare_announcement(
         self, content: dict[str, Any]
-    ) -> tuple[dict[str, int], dict[str, str], Optional[View]]:
+    ) -> tuple[dict[str, str], Optional[View]]:
         """Format message content by filling placeholders with data and adding buttons."""
         return (
-            content["time"],
             {
                 "title": content["title"],
                 "description": content["description"],
@@ -42,14 +43,13 @@ class RefillButton(View):
             style=ButtonStyle.green,
         )
         button.callback = self.refill_button
+        self.button: Button = button
         self.add_item(button)
 
     async def refill_button(self, interaction: Interaction) -> None:
         """Callback for the refill button."""
         self.button_clicked = True
-        for item in self.children:
-            if isinstance(item, Button):
-                item.disabled = True
+        self.button.disabled = True
 
         await interaction.response.edit_message(view=self)
         await interaction.followup.send(
@@ -58,8 +58,16 @@ class RefillButton(View):
 
 
 async def setup(bot: Bot) -> None:
-    """Load environment variables and add Elsa cog to the bot."""
-    load_dotenv()
-    channel_id: int = int(getenv("ELSA_CHANNEL"))
-    messages_path: str = getenv("MESSAGES_JSON")
-    await bot.add_cog(Elsa(bot=bot, channel_id=channel_id, messages_path=messages_path))
+    """Add the Elsa cog to the bot if its channel is configured."""
+    config: EnvConfig = env_config()
+    if config.elsa_channel is None:
+        logger.warning("Elsa cog disabled: ELSA_CHANNEL missing or invalid")
+        return
+
+    await bot.add_cog(
+        Elsa(
+            bot=bot,
+            channel_id=config.elsa_channel,
+            messages_path=config.messages_json,
+        )
+    )
@@ -1,13 +1,15 @@
 """General class cog for QuBot."""
 
-from os import getenv
+from logging import Logger, getLogger
 from typing import Any, Optional
 
 from discord.ext.commands import Bot
 from discord.ui import View
-from dotenv import load_dotenv
 
 from cogs.announcements import Announcements
+from utils import EnvConfig, env_config
+
+logger: Logger = getLogger(__name__)
 
 
 class General(Announcements):
@@ -23,31 +25,47 @@ class General(Announcements):
         """Initialize the General cog."""
         self.data: dict[str, str] = data
         super().__init__(bot, channel_id, messages_path)
+        self.descriptions: dict[str, str] = {
+            content["description"]: content["description"].format_map(self.data)
+            for content in self.messages[self.message_key]["content"]
+        }
 
-    def prepare_announcement(
+    async def prepare_announcement(
         self, content: dict[str, Any]
-    ) -> tuple[dict[str, int], dict[str, str], Optional[View]]:
-        """Format message content by filling placeholders with data."""
+    ) -> tuple[dict[str, str], Optional[View]]:
+        """Format message content using the descriptions filled in at init."""
         return (
-            content["time"],
             {
                 "title": content["title"],
-                "description": content["description"].format(**self.data),
+                "description": self.descriptions[content["description"]],
             },
             None,
         )
 
 
 async def setup(bot: Bot) -> None:
-    """Load environment variables and add the General cog to the bot."""
-    load_dotenv()
+    """Add the General cog to the bot if its settings are configured."""
+    config: EnvConfig = env_config()
+    if (
+        config.general_channel is None
+        or config.monday_meeting_zoom_url is None
+        or config.monday_meeting_minutes_url is None
+    ):
+        logger.warning(
+            "General cog disabled: GENERAL_CHANNEL, MONDAY_MEETING_ZOOM_URL or "
+            "MONDAY_MEETING_MINUTES_URL missing or invalid"
+        )
+        return
 
-    channel_id: int = int(getenv("GENERAL_CHANNEL"))
-    messages_path: str = getenv("MESSAGES_JSON")
     data: dict[str, str] = {
-        "link": getenv("MONDAY_MEETING_ZOOM_URL"),
-        "minutes": getenv("MONDAY_MEETING_MINUTES_URL"),
+        "link": config.monday_meeting_zoom_url,
+        "minutes": config.monday_meeting_minutes_url,
     }
     await bot.add_cog(
-        General(bot=bot, channel_id=channel_id, messages_path=messages_path, data=data)
+        General(
+            bot=bot,
+            channel_id=config.general_channel,
+            messages_path=config.messages_json,
+            data=data,
+        )
     )
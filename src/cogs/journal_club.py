@@ -1,14 +1,25 @@
 """JournalClub class cog for QuBot."""
 
-from os import getenv
-from typing import Any, Optional
+from asyncio import Lock, sleep, to_thread
+from logging import Logger, getLogger
+from random import random
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Optional
 
-from discord.ext.commands import Bot
+from discord.ext.commands import Bot, Context, command, has_permissions
 from discord.ui import View
-from dotenv import load_dotenv
 
 from cogs.announcements import Announcements
-from utils import load_data, parse_data
+from utils import EnvConfig, env_config, load_data, parse_data
+
+if TYPE_CHECKING:
+    from gspread import Client, Spreadsheet
+
+DATA_TTL: float = 3600.0
+SPREADSHEET_TTL: float = 86400.0
+FETCH_ATTEMPTS: int = 3
+REFRESH_COOLDOWN: float = 300.0
+logger: Logger = getLogger(__name__)
 
 
 class JournalClub(Announcements):
@@ -19,29 +30,114 @@ class JournalClub(Announcements):
         bot: Bot,
         channel_id: int,
         messages_path: str,
-        service_account_path: str,
+        client: "Client",
         spreadsheet_url: str,
     ) -> None:
         """Initialize the JournalClub cog."""
-        self.service_account_path: str = service_account_path
+        self.client: "Client" = client
         self.spreadsheet_url: str = spreadsheet_url
+        self._spreadsheet: Optional["Spreadsheet"] = None
+        self._spreadsheet_opened_at: float = 0.0
+        self._rows: Optional[list[dict[str, str]]] = None
+        self._rows_loaded_at: Optional[float] = None
+        self._refresh_failed_at: Optional[float] = None
+        self._rows_lock: Lock = Lock()
         super().__init__(bot, channel_id, messages_path)
 
-    def prepare_announcement(
+    async def get_data(self) -> dict[str, str]:
+        """Return the next journal club entry, re-reading the sheet after DATA_TTL.
+
+        Concurrent callers wait on a lock so an expired cache is fetched only once,
+        and after a failed refresh the cached rows are served for REFRESH_COOLDOWN.
+        """
+        async with self._rows_lock:
+            now: float = monotonic()
+            if (
+                self._rows_loaded_at is None
+                or now - self._rows_loaded_at >= DATA_TTL
+            ) and (
+                self._refresh_failed_at is None
+                or now - self._refresh_failed_at >= REFRESH_COOLDOWN
+            ):
+                await self.refresh_rows()
+        return parse_data(self._rows)
+
+    async def refresh_rows(self) -> None:
+        """Re-read the sheet, retrying with jittered exponential backoff.
+
+        If every attempt fails, the last rows read successfully are kept.
+        """
+        from google.auth.exceptions import RefreshError, TransportError
+        from gspread.exceptions import APIError
+        from requests import RequestException
+
+        errors: tuple[type[Exception], ...] = (
+            APIError,
+            RequestException,
+            RefreshError,
+            TransportError,
+        )
+        for attempt in range(FETCH_ATTEMPTS):
+            try:
+                self._rows = await to_thread(self.load_rows)
+            except errors:
+                if attempt == FETCH_ATTEMPTS - 1:
+                    if self._rows is None:
+                        raise
+                    logger.warning(
+                        "Google Sheets unavailable, using cached rows", exc_info=True
+                    )
+                    self._refresh_failed_at = monotonic()
+                    return
+                await sleep(2**attempt + random())
+            else:
+                self._rows_loaded_at = monotonic()
+                self._refresh_failed_at = None
+                return
+
+    def load_rows(self) -> list[dict[str, str]]:
+        """Fetch the sheet rows; blocking, so run it in a worker thread."""
+        return load_data(self.get_spreadsheet(), self.spreadsheet_url)
+
+    def get_spreadsheet(self) -> "Spreadsheet":
+        """Return the opened spreadsheet, reopening it after SPREADSHEET_TTL."""
+        if (
+            self._spreadsheet is None
+            or monotonic() - self._spreadsheet_opened_at >= SPREADSHEET_TTL
+        ):
+            self._spreadsheet = self.client.open_by_url(self.spreadsheet_url)
+            self._spreadsheet_opened_at = monotonic()
+        return self._spreadsheet
+
+    def clear_data(self) -> None:
+        """Expire the cached sheet data so the next read fetches it again."""
+        self._rows_loaded_at = None
+        self._refresh_failed_at = None
+
+    async def cog_unload(self) -> None:
+        """Remove scheduled jobs and expire the cached sheet data."""
+        await super().cog_unload()
+        self.clear_data()
+
+    @command(name="reminder_refresh")
+    @has_permissions(administrator=True)
+    async def reminder_refresh(self, ctx: Context) -> None:
+        """Force the next Journal Club reminder to re-read the spreadsheet."""
+        self.clear_data()
+        await ctx.send("Journal Club data will be reloaded on the next reminder.")
+
+    async def prepare_announcement(
         self, content: dict[str, Any]
-    ) -> tuple[dict[str, int], dict[str, str], Optional[View]]:
+    ) -> tuple[dict[str, str], Optional[View]]:
         """Format message content by filling placeholders with data."""
-        data: dict[str, str] = parse_data(
-            load_data(self.service_account_path, self.spreadsheet_url)
-        )
+        data: dict[str, str] = await self.get_data()
         return (
-            content["time"],
             {
                 "title": content["title"],
-                "description": content["description"].format(**data),
+                "description": content["description"].format_map(data),
                 "add_field": {
                     "name": content["add_field"]["name"],
-                    "value": content["add_field"]["value"].format(**data),
+                    "value": content["add_field"]["value"].format_map(data),
                 },
             },
             None,
@@ -49,20 +145,26 @@ class JournalClub(Announcements):
 
 
 async def setup(bot: Bot) -> None:
-    """Load environment variables and add the JournalClub cog to the bot."""
-    load_dotenv()
-
-    journal_club_channel_id: int = int(getenv("JOURNAL_CLUB_CHANNEL"))
-    messages_path: str = getenv("MESSAGES_JSON")
-    service_account_path: str = getenv("SERVICE_ACCOUNT_JSON")
-    spreadsheet_url: str = getenv("JOURNAL_CLUB_SPREADSHEET_URL")
+    """Add the JournalClub cog to the bot if its settings are configured."""
+    config: EnvConfig = env_config()
+    if (
+        config.journal_club_channel is None
+        or config.journal_club_spreadsheet_url is None
+        or config.service_account_json is None
+    ):
+        logger.warning(
+            "JournalClub cog disabled: JOURNAL_CLUB_CHANNEL, "
+            "JOURNAL_CLUB_SPREADSHEET_URL or SERVICE_ACCOUNT_JSON missing or invalid"
+        )
+        return
 
+    client: "Client" = await bot.get_gspread_client(config.service_account_json)
     await bot.add_cog(
         JournalClub(
             bot=bot,
-            channel_id=journal_club_channel_id,
-            messages_path=messages_path,
-            service_account_path=service_account_path,
-            spreadsheet_url=spreadsheet_url,
+            channel_id=config.journal_club_channel,
+            messages_path=config.messages_json,
+            client=client,
+            spreadsheet_url=config.journal_club_spreadsheet_url,
         )
     )
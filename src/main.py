@@ -1,37 +1,101 @@
 """QuBot setup: loads cogs and runs the bot."""
 
+from asyncio import gather, to_thread
+from atexit import register
+from logging import Formatter, Logger, StreamHandler, getLogger
+from logging.handlers import QueueHandler, QueueListener
 from os import getenv
+from queue import SimpleQueue
 
-from discord import Intents
+from apscheduler.executors.asyncio import AsyncIOExecutor
+from apscheduler.jobstores.memory import MemoryJobStore
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from discord import AllowedMentions, Intents
 from discord.ext import commands
 from dotenv import load_dotenv
+from gspread import Client, service_account
+
+from utils import ZONE_INFO
 
 load_dotenv()
 
 TOKEN: str = getenv("DISCORD_TOKEN")
+EXTENSIONS: tuple[str, ...] = ("cogs.elsa", "cogs.general", "cogs.journal_club")
 intents: Intents = Intents.all()
+logger: Logger = getLogger(__name__)
+
+console_handler: StreamHandler = StreamHandler()
+console_handler.setFormatter(
+    Formatter(
+        "[{asctime}] [{levelname:<8}] {name}: {message}", "%Y-%m-%d %H:%M:%S", style="{"
+    )
+)
+log_queue: SimpleQueue = SimpleQueue()
+log_listener: QueueListener = QueueListener(
+    log_queue, console_handler, respect_handler_level=True
+)
 
 
 class QuBot(commands.Bot):
     """QuBot main class."""
 
+    scheduler: AsyncIOScheduler
+    gspread_client: Client | None = None
+
     async def setup_hook(self) -> None:
-        """Load cogs on startup."""
-        await self.load_extension("cogs.elsa")
-        await self.load_extension("cogs.general")
-        await self.load_extension("cogs.journal_club")
+        """Start the shared scheduler and load the cogs."""
+        self.scheduler = AsyncIOScheduler(
+            timezone=ZONE_INFO,
+            executors={"default": AsyncIOExecutor()},
+            jobstores={"default": MemoryJobStore()},
+            job_defaults={
+                "coalesce": True,
+                "max_instances": 1,
+                "misfire_grace_time": 60,
+            },
+        )
+        self.scheduler.start()
+        await gather(*(self.load_extension(name) for name in EXTENSIONS))
+
+    async def get_gspread_client(self, filename: str) -> Client:
+        """Return the shared Google Sheets client, authenticating on first use."""
+        if self.gspread_client is None:
+            self.gspread_client = await to_thread(service_account, filename=filename)
+        return self.gspread_client
 
+    async def close(self) -> None:
+        """Stop the shared scheduler before disconnecting."""
+        scheduler: AsyncIOScheduler | None = getattr(self, "scheduler", None)
+        if scheduler is not None and scheduler.running:
+            scheduler.shutdown(wait=False)
+        await super().close()
 
-qubot: QuBot = QuBot(command_prefix="/", intents=intents)
 
+qubot: QuBot = QuBot(
+    command_prefix="/", intents=intents, allowed_mentions=AllowedMentions.none()
+)
 
-@qubot.event
+
+@qubot.listen()
 async def on_ready() -> None:
     """Triggered when the bot connects."""
-    print(f"QuBot connected as {qubot.user}")
+    logger.info("QuBot connected as %s", qubot.user)
+
+
+def main() -> None:
+    """Start the logging listener and run the bot."""
+    if not TOKEN:
+        raise EnvironmentError("DISCORD_TOKEN not found in the .env file.")
+
+    log_listener.start()
+    register(log_listener.stop)
+    qubot.run(
+        TOKEN,
+        log_handler=QueueHandler(log_queue),
+        log_formatter=Formatter("%(message)s"),
+        root_logger=True,
+    )
 
 
-if TOKEN:
-    qubot.run(TOKEN)
-else:
-    raise EnvironmentError("DISCORD_TOKEN not found in the .env file.")
+if __name__ == "__main__":
+    main()
@@ -1,40 +1,169 @@
 """Utility functions"""
 
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from functools import lru_cache
 from json import load
-from typing import Any
+from logging import Logger, getLogger
+from operator import itemgetter
+from os import getenv, stat
+from os.path import abspath
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from zoneinfo import ZoneInfo
 
-from gspread import Client, Spreadsheet, Worksheet, service_account
-from pandas import DataFrame, to_datetime
+if TYPE_CHECKING:
+    from gspread import Spreadsheet, Worksheet
+
+try:
+    from orjson import loads
+except ImportError:
+    loads = None
+
+ZONE_INFO: ZoneInfo = ZoneInfo("Europe/Rome")
+# Day-first sheet layouts, tried in order; Sheets may export times with seconds.
+DATE_FORMATS: tuple[str, ...] = ("%d/%m/%Y", "%d/%m/%y")
+TIME_FORMATS: tuple[str, ...] = ("%H:%M", "%H:%M:%S")
+logger: Logger = getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class EnvConfig:
+    """Settings read from the environment (.env) file."""
+
+    general_channel: int | None
+    elsa_channel: int | None
+    journal_club_channel: int | None
+    journal_club_spreadsheet_url: str | None
+    monday_meeting_zoom_url: str | None
+    monday_meeting_minutes_url: str | None
+    service_account_json: str | None
+    messages_json: str
+
+
+@lru_cache(maxsize=1)
+def env_config() -> EnvConfig:
+    """Read the settings from the environment once.
+
+    Only MESSAGES_JSON is required; each cog checks its own settings in setup().
+    """
+    return EnvConfig(
+        general_channel=_channel_env("GENERAL_CHANNEL"),
+        elsa_channel=_channel_env("ELSA_CHANNEL"),
+        journal_club_channel=_channel_env("JOURNAL_CLUB_CHANNEL"),
+        journal_club_spreadsheet_url=_optional_env("JOURNAL_CLUB_SPREADSHEET_URL"),
+        monday_meeting_zoom_url=_optional_env("MONDAY_MEETING_ZOOM_URL"),
+        monday_meeting_minutes_url=_optional_env("MONDAY_MEETING_MINUTES_URL"),
+        service_account_json=_optional_env("SERVICE_ACCOUNT_JSON"),
+        messages_json=_require_env("MESSAGES_JSON"),
+    )
+
+
+def _require_env(name: str) -> str:
+    """Return an environment variable, raising if it is unset or empty."""
+    value: str | None = getenv(name)
+    if not value:
+        raise EnvironmentError(f"{name} not found in the .env file.")
+    return value
+
+
+def _optional_env(name: str) -> str | None:
+    """Return an environment variable, or None if it is unset or empty."""
+    return getenv(name) or None
+
+
+def _channel_env(name: str) -> int | None:
+    """Return a channel ID from the environment, or None if unset or invalid."""
+    value: str | None = getenv(name)
+    return int(value) if value and value.isdigit() else None
 
 
 def load_json(filename: str) -> dict[str, Any]:
-    """Load JSON data from a file."""
-    with open(filename, "r", encoding="utf-8") as f:
+    """Load JSON data from a file, reusing the parsed result until it changes."""
+    path: str = abspath(filename)
+    return _load_json_cached(path, stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _load_json_cached(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a JSON file; cached on its path and modification time."""
+    if loads is not None:
+        return loads(Path(path).read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
         data: dict[str, Any] = load(f)
     return data
 
 
 def load_data(
-    service_account_path: str, spreadsheet_url: str, sheet: int | str = 0
-) -> DataFrame:
-    """Load data from a Google Sheet into a DataFrame."""
-    gc: Client = service_account(filename=service_account_path)
-    sh: Spreadsheet = gc.open_by_url(spreadsheet_url)
+    sh: "Spreadsheet", spreadsheet_url: str, sheet: int | str = 0
+) -> list[dict[str, str]]:
+    """Load the rows of a Google Sheet as a list of dictionaries."""
     if isinstance(sheet, int):
-        worksheet: Worksheet = sh.get_worksheet(sheet)
+        worksheet: "Worksheet" = sh.get_worksheet(sheet)
     else:
-        worksheet: Worksheet = sh.worksheet(sheet)
-    data: list[dict[str, Any]] = worksheet.get_all_records()
-    df: DataFrame = DataFrame(data)
-    df["spreadsheet"] = spreadsheet_url
-    return df
-
-
-def parse_data(df: DataFrame) -> dict[str, Any]:
-    """Parse the DataFrame and return the next upcoming entry as a dictionary."""
-    df["datetime"] = to_datetime(df["date"] + " " + df["time"], dayfirst=True)
-    df_next = df[df["datetime"] > datetime.now()]
-    row = df_next.loc[df_next["datetime"].idxmin()].copy()
-    row["link"] = df["link"][0]
-    return dict(row)
+        worksheet: "Worksheet" = sh.worksheet(sheet)
+    header, *values = worksheet.get_all_values()
+    rows: list[dict[str, str]] = []
+    for value in values:
+        if not any(cell.strip() for cell in value):
+            continue  # Fully blank row, e.g. padding below the last entry.
+        row: dict[str, str] = dict(zip(header, value))
+        row["spreadsheet"] = spreadsheet_url
+        rows.append(row)
+    return rows
+
+
+def parse_data(rows: list[dict[str, str]]) -> dict[str, Any]:
+    """Return the next upcoming entry of the sheet rows."""
+    now: datetime = datetime.now(ZONE_INFO)
+    upcoming: list[tuple[datetime, dict[str, str]]] = []
+    for row in rows:
+        try:
+            when: datetime = _entry_datetime(row)
+        except ValueError:
+            logger.warning(
+                "Skipping sheet row with invalid date/time: %r %r",
+                row.get("date"),
+                row.get("time"),
+            )
+            continue
+        if when > now:
+            upcoming.append((when, row))
+    entry: tuple[datetime, dict[str, str]] | None = min(
+        upcoming, key=itemgetter(0), default=None
+    )
+    if entry is None:
+        raise ValueError("No upcoming entries in the spreadsheet.")
+    _, row = entry
+    return dict(row, link=rows[0]["link"])
+
+
+def _entry_datetime(row: dict[str, str]) -> datetime:
+    """Combine the date and time columns of a sheet row as Rome local time."""
+    return datetime.combine(
+        _parse_date(row.get("date", "")),
+        _parse_time(row.get("time", "")),
+        tzinfo=ZONE_INFO,
+    )
+
+
+@lru_cache(maxsize=256)
+def _parse_date(value: str) -> date:
+    """Parse a sheet date; cached since weekly schedules repeat few values."""
+    return _strptime(value, DATE_FORMATS).date()
+
+
+@lru_cache(maxsize=64)
+def _parse_time(value: str) -> time:
+    """Parse a sheet time; cached since meetings share a handful of slots."""
+    return _strptime(value, TIME_FORMATS).time()
+
+
+def _strptime(value: str, formats: tuple[str, ...]) -> datetime:
+    """Parse a sheet cell with the first matching format; raise ValueError if none."""
+    for fmt in formats:
+        try:
+            return datetime.strptime(value.strip(), fmt)
+        except ValueError:
+            pass
+    raise ValueError(f"{value!r} does not match any of {formats}")